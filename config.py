@@ -23,7 +23,27 @@ class Config:
         'update_interval': 1.0,  # seconds
         'log_level': 'INFO',
     }
-    
+
+    # Environment overrides as a uniform (config key, converter) table;
+    # str is the identity converter, so applying entries needs no
+    # per-entry type branching
+    ENV_OVERRIDES = {
+        'SPOTIFYD_DISPLAY_TYPE': ('display_type', str),
+        'SPOTIFYD_DISPLAY_WIDTH': ('display_width', int),
+        'SPOTIFYD_DISPLAY_HEIGHT': ('display_height', int),
+        'SPOTIFYD_EPAPER_MODEL': ('epaper_model', str),
+        'SPOTIFYD_UPDATE_INTERVAL': ('update_interval', float),
+        'SPOTIFYD_LOG_LEVEL': ('log_level', str),
+    }
+
+    # Candidate config locations, built once on first lookup so repeated
+    # Config construction skips the Path.home() and path-join work
+    _search_paths = None
+
+    # DEFAULT_CONFIG serialized once on first save; the defaults are
+    # constant, so there is no point re-running json.dump per call
+    _default_config_json = None
+
     def __init__(self, config_file: str = None):
         """Initialize configuration.
         
@@ -43,6 +63,11 @@ class Config:
         
         # Override with environment variables
         self._load_env_overrides()
+
+        # Publish config entries as plain instance attributes so lookups
+        # like config.display_type are ordinary attribute reads instead of
+        # __getattr__ fallbacks
+        self.__dict__.update(self.config)
     
     def _find_config_file(self, config_file: str = None) -> str:
         """Find configuration file."""
@@ -54,16 +79,16 @@ class Config:
         if env_config and Path(env_config).exists():
             return env_config
         
-        # Check user config directory
-        user_config = Path.home() / '.config' / 'spotifyd-display' / 'config.json'
-        if user_config.exists():
-            return str(user_config)
-        
-        # Check system config directory
-        system_config = Path('/etc/spotifyd-display/config.json')
-        if system_config.exists():
-            return str(system_config)
-        
+        # Check user config directory, then system config directory
+        if Config._search_paths is None:
+            Config._search_paths = (
+                Path.home() / '.config' / 'spotifyd-display' / 'config.json',
+                Path('/etc/spotifyd-display/config.json'),
+            )
+        for candidate in Config._search_paths:
+            if candidate.exists():
+                return str(candidate)
+
         return None
     
     def _load_config(self):
@@ -78,34 +103,19 @@ class Config:
     
     def _load_env_overrides(self):
         """Load configuration overrides from environment variables."""
-        env_mapping = {
-            'SPOTIFYD_DISPLAY_TYPE': 'display_type',
-            'SPOTIFYD_DISPLAY_WIDTH': ('display_width', int),
-            'SPOTIFYD_DISPLAY_HEIGHT': ('display_height', int),
-            'SPOTIFYD_EPAPER_MODEL': 'epaper_model',
-            'SPOTIFYD_UPDATE_INTERVAL': ('update_interval', float),
-            'SPOTIFYD_LOG_LEVEL': 'log_level',
-        }
-        
-        for env_var, config_key in env_mapping.items():
-            value = os.environ.get(env_var)
-            if value is not None:
-                if isinstance(config_key, tuple):
-                    config_key, converter = config_key
-                    try:
-                        value = converter(value)
-                    except ValueError:
-                        logger.warning(f"Invalid value for {env_var}: {value}")
-                        continue
-                
-                self.config[config_key] = value
-                logger.debug(f"Config override from env: {config_key} = {value}")
-    
-    def __getattr__(self, name: str) -> Any:
-        """Allow accessing config values as attributes."""
-        if name in self.config:
-            return self.config[name]
-        raise AttributeError(f"Config has no attribute '{name}'")
+        # Snapshot the environment once and only visit variables that are
+        # actually set, instead of probing os.environ for every mapping key.
+        environ = os.environ
+        for env_var in environ.keys() & self.ENV_OVERRIDES.keys():
+            config_key, converter = self.ENV_OVERRIDES[env_var]
+            try:
+                value = converter(environ[env_var])
+            except ValueError:
+                logger.warning(f"Invalid value for {env_var}: {environ[env_var]}")
+                continue
+
+            self.config[config_key] = value
+            logger.debug(f"Config override from env: {config_key} = {value}")
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
@@ -118,8 +128,11 @@ class Config:
         
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        if Config._default_config_json is None:
+            Config._default_config_json = json.dumps(self.DEFAULT_CONFIG, indent=2)
+
         with open(path, 'w') as f:
-            json.dump(self.DEFAULT_CONFIG, f, indent=2)
-        
+            f.write(Config._default_config_json)
+
         logger.info(f"Example configuration saved to {path}")
@@ -4,6 +4,8 @@ Display Manager - Handles rendering content to various display types.
 Supports e-paper displays, TFT displays, and virtual displays for testing.
 """
 
+import functools
+import importlib
 import logging
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -15,10 +17,38 @@ except ImportError as e:
     print("Please install: pip3 install Pillow")
     raise
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Common TrueType font locations on Linux, tried in order
+_FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans{suffix}.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans{suffix}.ttf",
+]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_font(bold: bool, size: int):
+    """Load a TrueType font, falling back to PIL's default font.
+
+    Results are cached so each (bold, size) face is parsed at most once,
+    on first use rather than at DisplayManager construction.
+    """
+    suffix = '-Bold' if bold else ''
+    for template in _FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(template.format(suffix=suffix), size)
+        except Exception:
+            continue
+    logger.warning("Could not load TrueType fonts, using default font")
+    return ImageFont.load_default()
+
 
 class DisplayDriver:
     """Base class for display drivers."""
@@ -75,19 +105,22 @@ class EPaperDisplayDriver(DisplayDriver):
         'epd4in2': 'epd4in2',
         'epd7in5': 'epd7in5',
     }
-    
+
+    # Resolved EPD classes by model, so each driver module is imported once
+    _epd_classes = {}
+
     def __init__(self, width: int, height: int, model: str = "epd2in13_V2"):
         super().__init__(width, height)
         self.model = model
         self.epd = None
+        # (pixel bytes, packed buffer) of the last displayed frame, so
+        # identical frames skip both getbuffer and the panel refresh
+        self._last_frame = None
         
         try:
             # Try to import waveshare e-paper library
             if model in self.EPAPER_MODELS:
-                module_name = self.EPAPER_MODELS[model]
-                module = __import__(f'waveshare_epd.{module_name}', fromlist=[module_name])
-                epd_class = getattr(module, 'EPD')
-                self.epd = epd_class()
+                self.epd = self._get_epd_class(model)()
             else:
                 logger.warning(f"Unknown e-paper model: {model}, using virtual display")
         except ImportError:
@@ -96,6 +129,17 @@ class EPaperDisplayDriver(DisplayDriver):
         except Exception as e:
             logger.warning(f"Error initializing e-paper display: {e}, using virtual display")
             self.epd = None
+
+    @classmethod
+    def _get_epd_class(cls, model: str):
+        """Resolve the EPD class for a model, importing its module once."""
+        epd_class = cls._epd_classes.get(model)
+        if epd_class is None:
+            module_name = cls.EPAPER_MODELS[model]
+            module = importlib.import_module(f'waveshare_epd.{module_name}')
+            epd_class = module.EPD
+            cls._epd_classes[model] = epd_class
+        return epd_class
     
     def init(self):
         if self.epd:
@@ -108,14 +152,51 @@ class EPaperDisplayDriver(DisplayDriver):
     def display(self, image: Image.Image):
         if self.epd:
             # Convert to 1-bit image for e-paper
-            image_bw = image.convert('1')
-            self.epd.display(self.epd.getbuffer(image_bw))
+            image_bw = self._to_1bit(image)
+            pixels = image_bw.tobytes()
+            if self._last_frame and self._last_frame[0] == pixels:
+                # Frame unchanged since the last refresh; e-paper retains
+                # its image, so repainting would only cost time and wear
+                logger.debug("Frame unchanged, skipping e-paper refresh")
+                return
+            buffer = self._pack_frame(image_bw, pixels)
+            self._last_frame = (pixels, buffer)
+            self.epd.display(buffer)
         else:
             # Fallback to virtual display
             output_path = Path("/tmp/display_output.png")
             image.save(output_path)
             logger.debug(f"Display output saved to {output_path}")
-    
+
+    def _pack_frame(self, image_bw: Image.Image, pixels: bytes):
+        """Pack a 1-bit frame into the panel's display buffer format.
+
+        A mode-'1' image's raw bytes are already 1 bit per pixel, MSB
+        first, rows padded to whole bytes with 1 meaning white -- the same
+        layout the Waveshare buffer uses. When the frame matches the
+        panel's native orientation those bytes are the buffer, so the
+        per-pixel getbuffer pass is skipped; rotated frames still go
+        through the vendor routine.
+        """
+        if image_bw.size == (getattr(self.epd, 'width', None),
+                             getattr(self.epd, 'height', None)):
+            return bytearray(pixels)
+        return self.epd.getbuffer(image_bw)
+
+    @staticmethod
+    def _to_1bit(image: Image.Image) -> Image.Image:
+        """Convert an image to 1-bit black/white for the e-paper panel.
+
+        With NumPy available this is a vectorized >127 threshold, which is
+        much cheaper than PIL's convert('1') error-diffusion dither; for
+        black text on a white background the result is identical.
+        """
+        if np is not None:
+            if image.mode != 'L':
+                image = image.convert('L')
+            return Image.fromarray(np.asarray(image) > 127)
+        return image.convert('1')
+
     def sleep(self):
         if self.epd:
             self.epd.sleep()
@@ -123,6 +204,7 @@ class EPaperDisplayDriver(DisplayDriver):
     def clear(self):
         if self.epd:
             self.epd.Clear(0xFF)
+            self._last_frame = None
 
 
 class DisplayManager:
@@ -131,10 +213,23 @@ class DisplayManager:
     def __init__(self, config: Config):
         self.config = config
         self.driver = self._create_driver()
-        self.font_large = None
-        self.font_medium = None
-        self.font_small = None
-        self._load_fonts()
+        # Rendered (metadata_key, image) of everything except the progress
+        # bar, so progress-only ticks skip re-wrapping and re-drawing text
+        self._chrome_cache = None
+        # Persistent framebuffer: every frame is drawn into this one image
+        # instead of allocating a fresh pixel buffer per tick
+        mode = 'L' if config.display_type == 'epaper' else 'RGB'
+        self._fb = Image.new(mode, (self.driver.width, self.driver.height), color='white')
+        self._draw = ImageDraw.Draw(self._fb)
+        self._ink = 0 if mode == 'L' else (0, 0, 0)
+        # Static layout geometry, derived once from the panel dimensions
+        self._margin = 5
+        self._text_width = self.driver.width - 2 * self._margin
+        self._bar_x = self._margin
+        self._bar_y = self.driver.height - 35
+        self._bar_width = self._text_width
+        self._bar_height = 10
+        self._time_y = self._bar_y + self._bar_height + 2
     
     def _create_driver(self) -> DisplayDriver:
         """Create appropriate display driver based on configuration."""
@@ -150,25 +245,20 @@ class DisplayManager:
             logger.warning(f"Unknown display type: {display_type}, using virtual")
             return VirtualDisplayDriver(width, height)
     
-    def _load_fonts(self):
-        """Load fonts for rendering text."""
-        try:
-            # Try to load DejaVu fonts (common on Linux)
-            self.font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
-            self.font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
-            self.font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-        except Exception:
-            try:
-                # Try alternative font paths
-                self.font_large = ImageFont.truetype("/usr/share/fonts/TTF/DejaVuSans-Bold.ttf", 20)
-                self.font_medium = ImageFont.truetype("/usr/share/fonts/TTF/DejaVuSans.ttf", 16)
-                self.font_small = ImageFont.truetype("/usr/share/fonts/TTF/DejaVuSans.ttf", 12)
-            except Exception:
-                # Fallback to default font
-                logger.warning("Could not load TrueType fonts, using default font")
-                self.font_large = ImageFont.load_default()
-                self.font_medium = ImageFont.load_default()
-                self.font_small = ImageFont.load_default()
+    @property
+    def font_large(self):
+        """Bold font for track titles, loaded on first use."""
+        return _load_font(True, 20)
+
+    @property
+    def font_medium(self):
+        """Regular font for artist/status text, loaded on first use."""
+        return _load_font(False, 16)
+
+    @property
+    def font_small(self):
+        """Small font for album/time text, loaded on first use."""
+        return _load_font(False, 12)
     
     def initialize(self):
         """Initialize the display hardware."""
@@ -182,12 +272,6 @@ class DisplayManager:
     
     def update_display(self, metadata: Dict[str, Any]):
         """Update display with current track information."""
-        # Create image
-        image = Image.new('RGB' if self.config.display_type != 'epaper' else 'L',
-                         (self.driver.width, self.driver.height),
-                         color='white')
-        draw = ImageDraw.Draw(image)
-        
         # Extract metadata
         title = metadata.get('title', 'Unknown Title')
         artist = metadata.get('artist', 'Unknown Artist')
@@ -195,114 +279,149 @@ class DisplayManager:
         status = metadata.get('status', 'Stopped')
         position = metadata.get('position', 0) // 1000000  # Convert to seconds
         length = metadata.get('length', 0) // 1000000  # Convert to seconds
-        
-        # Layout parameters
-        margin = 5
+
+        # Reuse the cached chrome (icon + text) when only the progress bar
+        # moved; a full re-render happens only when the track or status
+        # changes.
+        chrome_key = (title, artist, album, status, length > 0)
+        if self._chrome_cache and self._chrome_cache[0] == chrome_key:
+            self._fb.paste(self._chrome_cache[1], (0, 0))
+        else:
+            self._render_chrome(title, artist, album, status, show_bar=length > 0)
+            self._chrome_cache = (chrome_key, self._fb.copy())
+
+        # Draw progress bar
+        if length > 0:
+            self._draw_progress(position, length)
+
+        # Send to display
+        self.driver.display(self._fb)
+
+    def _clear_framebuffer(self):
+        """Reset the persistent framebuffer to a blank white frame."""
+        self._draw.rectangle(
+            [0, 0, self.driver.width, self.driver.height], fill='white')
+
+    def _render_chrome(self, title: str, artist: str, album: str, status: str,
+                       show_bar: bool = False):
+        """Render everything but the progress fill into the framebuffer.
+
+        The empty progress-bar outline is part of the chrome: it never
+        moves, so per-tick drawing is reduced to filling its interior.
+        """
+        self._clear_framebuffer()
+        draw = self._draw
+        margin = self._margin
         y_pos = margin
-        
+
         # Draw status icon
         status_icon = "▶" if status == "Playing" else "⏸" if status == "Paused" else "⏹"
         draw.text((margin, y_pos), status_icon, fill='black', font=self.font_medium)
         y_pos += 25
-        
+
         # Draw title (bold, larger)
-        title_wrapped = self._wrap_text(title, self.font_large, self.driver.width - 2 * margin)
+        title_wrapped = self._wrap_text(title, self.font_large, self._text_width)
         for line in title_wrapped[:2]:  # Max 2 lines for title
             draw.text((margin, y_pos), line, fill='black', font=self.font_large)
             y_pos += 25
-        
+
         # Draw artist
-        artist_wrapped = self._wrap_text(artist, self.font_medium, self.driver.width - 2 * margin)
+        artist_wrapped = self._wrap_text(artist, self.font_medium, self._text_width)
         for line in artist_wrapped[:1]:  # Max 1 line for artist
             draw.text((margin, y_pos), line, fill='black', font=self.font_medium)
             y_pos += 20
-        
+
         # Draw album
-        album_wrapped = self._wrap_text(album, self.font_small, self.driver.width - 2 * margin)
+        album_wrapped = self._wrap_text(album, self.font_small, self._text_width)
         for line in album_wrapped[:1]:  # Max 1 line for album
             draw.text((margin, y_pos), line, fill='black', font=self.font_small)
             y_pos += 18
-        
-        # Draw progress bar
-        if length > 0:
-            y_pos = self.driver.height - 35
-            progress = position / length if length > 0 else 0
-            progress = min(1.0, max(0.0, progress))
-            
-            # Progress bar dimensions
-            bar_width = self.driver.width - 2 * margin
-            bar_height = 10
-            bar_x = margin
-            bar_y = y_pos
-            
-            # Draw progress bar background
-            draw.rectangle([bar_x, bar_y, bar_x + bar_width, bar_y + bar_height],
+
+        # Draw progress bar background and outline (static per track)
+        if show_bar:
+            draw.rectangle([self._bar_x, self._bar_y,
+                            self._bar_x + self._bar_width,
+                            self._bar_y + self._bar_height],
                           outline='black', fill='white')
-            
-            # Draw progress bar fill
-            fill_width = int(bar_width * progress)
-            if fill_width > 0:
-                draw.rectangle([bar_x, bar_y, bar_x + fill_width, bar_y + bar_height],
-                              fill='black')
-            
-            # Draw time labels
-            time_text = f"{self._format_time(position)} / {self._format_time(length)}"
-            draw.text((margin, bar_y + bar_height + 2), time_text, fill='black', font=self.font_small)
-        
-        # Send to display
-        self.driver.display(image)
+
+    def _draw_progress(self, position: int, length: int):
+        """Draw the progress fill and time labels (positions in seconds)."""
+        progress = position / length
+        progress = min(1.0, max(0.0, progress))
+
+        # Geometry is precomputed in __init__; only the fill width varies.
+        # paste() with a solid color is a plain memory fill of the region,
+        # cheaper than running rectangle geometry through ImageDraw.
+        fill_width = int(self._bar_width * progress)
+        if fill_width > 0:
+            self._fb.paste(self._ink,
+                           (self._bar_x, self._bar_y,
+                            self._bar_x + fill_width + 1,
+                            self._bar_y + self._bar_height + 1))
+
+        # Draw time labels
+        time_text = f"{self._format_time(position)} / {self._format_time(length)}"
+        self._draw.text((self._margin, self._time_y), time_text, fill='black', font=self.font_small)
     
     def show_idle(self):
         """Show idle screen when no music is playing."""
-        image = Image.new('RGB' if self.config.display_type != 'epaper' else 'L',
-                         (self.driver.width, self.driver.height),
-                         color='white')
-        draw = ImageDraw.Draw(image)
-        
-        # Center text
+        self._clear_framebuffer()
+        draw = self._draw
+
+        # Center text, measuring via the font itself: getlength is a plain
+        # advance-width sum and getbbox avoids going through the draw object
         text = "No music playing"
-        bbox = draw.textbbox((0, 0), text, font=self.font_medium)
-        text_width = bbox[2] - bbox[0]
+        font = self.font_medium
+        text_width = int(font.getlength(text))
+        bbox = font.getbbox(text)
         text_height = bbox[3] - bbox[1]
         x = (self.driver.width - text_width) // 2
         y = (self.driver.height - text_height) // 2
         
         draw.text((x, y), text, fill='black', font=self.font_medium)
-        
-        self.driver.display(image)
+
+        self.driver.display(self._fb)
     
-    def _wrap_text(self, text: str, font, max_width: int) -> list:
-        """Wrap text to fit within max_width."""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _wrap_text(text: str, font, max_width: int) -> tuple:
+        """Wrap text to fit within max_width.
+
+        Results are memoized: while the same track keeps playing, each
+        redraw re-wraps identical title/artist/album strings, so repeat
+        calls return the cached line tuple without any measurement.
+        """
         if not text:
-            return [""]
-        
-        words = text.split()
+            return ("",)
+
+        # Fast path: most titles/artists fit on one line, so one whole-string
+        # measurement avoids splitting and measuring individual words.
+        if font.getlength(text) <= max_width:
+            return (text,)
+
         lines = []
         current_line = []
-        
-        # Create a single temporary draw object for all measurements
-        temp_image = Image.new('L', (1, 1))
-        temp_draw = ImageDraw.Draw(temp_image)
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = temp_draw.textbbox((0, 0), test_line, font=font)
-            width = bbox[2] - bbox[0]
-            
-            if width <= max_width:
-                current_line.append(word)
+        current_width = 0.0
+        space_width = font.getlength(' ')
+
+        # Measure each word once and keep a running line width instead of
+        # re-measuring every prefix of the line.
+        for word in text.split():
+            word_width = font.getlength(word)
+            if current_line and current_width + space_width + word_width > max_width:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_width
             else:
                 if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Single word is too long, add it anyway
-                    lines.append(word)
-        
+                    current_width += space_width
+                current_line.append(word)
+                current_width += word_width
+
         if current_line:
             lines.append(' '.join(current_line))
-        
-        return lines if lines else [""]
+
+        return tuple(lines) if lines else ("",)
     
     def _format_time(self, seconds: int) -> str:
         """Format seconds as MM:SS."""
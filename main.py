@@ -23,19 +23,29 @@ except ImportError as e:
 from display_manager import DisplayManager
 from config import Config
 
-# Setup logging
-log_dir = Path.home() / '.local' / 'share' / 'spotifyd-display'
-log_dir.mkdir(parents=True, exist_ok=True)
-log_file = log_dir / 'spotifyd-display.log'
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(log_file)
-    ]
-)
+def _setup_logging():
+    """Configure stderr + file logging on the root logger.
+
+    Both handlers share one Formatter instance. The file handler is
+    created with delay=True, deferring the open() until a record is
+    actually emitted, and is pinned at INFO so per-tick debug traffic
+    never reaches disk I/O even when the configured log level is DEBUG.
+    """
+    log_dir = Path.home() / '.local' / 'share' / 'spotifyd-display'
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_file = log_dir / 'spotifyd-display.log'
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setLevel(logging.INFO)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    for handler in (logging.StreamHandler(), file_handler):
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+
+
+_setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -44,12 +54,21 @@ class MPRISClient:
     
     MPRIS_INTERFACE = "org.mpris.MediaPlayer2.Player"
     PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
-    
+
+    # Extraction schema: (result key, MPRIS metadata key, default)
+    METADATA_SCHEMA = (
+        ('title', 'xesam:title', 'Unknown Title'),
+        ('album', 'xesam:album', 'Unknown Album'),
+        ('length', 'mpris:length', 0),  # in microseconds
+        ('art_url', 'mpris:artUrl', ''),
+    )
+
     def __init__(self):
         self.bus = SessionBus()
         self.player_name = None
         self.player = None
         self.properties = None
+        self._subscription = None
         self._find_player()
     
     def _find_player(self):
@@ -92,6 +111,27 @@ class MPRISClient:
         except Exception as e:
             logger.error(f"Error finding media player: {e}")
     
+    def subscribe(self, callback) -> bool:
+        """Subscribe to PropertiesChanged signals from the player.
+
+        Args:
+            callback: Called as callback(interface, changed, invalidated)
+                      whenever the player's properties change.
+
+        Returns:
+            True if the subscription was established, False otherwise.
+        """
+        if not self.player:
+            return False
+
+        try:
+            self._subscription = self.player.PropertiesChanged.connect(callback)
+            logger.info(f"Subscribed to PropertiesChanged on {self.player_name}")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not subscribe to PropertiesChanged: {e}")
+            return False
+
     def get_metadata(self) -> Optional[Dict[str, Any]]:
         """Get current track metadata."""
         if not self.player or not self.properties:
@@ -100,24 +140,26 @@ class MPRISClient:
                 return None
         
         try:
-            metadata = self.properties.Get(self.MPRIS_INTERFACE, 'Metadata')
-            playback_status = self.properties.Get(self.MPRIS_INTERFACE, 'PlaybackStatus')
-            position = self.properties.Get(self.MPRIS_INTERFACE, 'Position')
-            
+            # One GetAll round-trip instead of three individual Gets
+            props = self.properties.GetAll(self.MPRIS_INTERFACE)
+            metadata = props.get('Metadata')
+            playback_status = props.get('PlaybackStatus')
+            position = props.get('Position')
+            if position is None:
+                # Some players omit Position from GetAll; fetch it directly
+                position = self.properties.Get(self.MPRIS_INTERFACE, 'Position')
+
             if not metadata:
                 return None
             
-            # Extract common fields
-            result = {
-                'title': metadata.get('xesam:title', 'Unknown Title'),
-                'artist': ', '.join(metadata.get('xesam:artist', ['Unknown Artist'])),
-                'album': metadata.get('xesam:album', 'Unknown Album'),
-                'length': metadata.get('mpris:length', 0),  # in microseconds
-                'position': position,  # in microseconds
-                'status': playback_status,  # Playing, Paused, or Stopped
-                'art_url': metadata.get('mpris:artUrl', ''),
-            }
-            
+            # Extract common fields via the schema table; only the artist
+            # list needs special handling (joined into one string)
+            result = {key: metadata.get(mpris_key, default)
+                      for key, mpris_key, default in self.METADATA_SCHEMA}
+            result['artist'] = ', '.join(metadata.get('xesam:artist', ['Unknown Artist']))
+            result['position'] = position  # in microseconds
+            result['status'] = playback_status  # Playing, Paused, or Stopped
+
             return result
         except Exception as e:
             logger.error(f"Error getting metadata: {e}")
@@ -134,6 +176,8 @@ class SpotifydDisplay:
         self.mpris_client = MPRISClient()
         self.display_manager = DisplayManager(config)
         self.last_metadata = None
+        self.last_metadata_key = None
+        self.main_loop = None
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -151,65 +195,102 @@ class SpotifydDisplay:
         
         try:
             self.display_manager.initialize()
-            self._update_loop()
+            if self.mpris_client.subscribe(self._on_properties_changed):
+                self._event_loop()
+            else:
+                # No signal available (e.g. player not yet running): fall
+                # back to the classic polling loop
+                logger.info("PropertiesChanged unavailable, polling instead")
+                self._update_loop()
         except Exception as e:
             logger.error(f"Error in main loop: {e}", exc_info=True)
         finally:
             self.stop()
-    
+
     def stop(self):
         """Stop the application."""
         if self.running:
             logger.info("Stopping Spotifyd E-Paper Display")
             self.running = False
+            if self.main_loop:
+                self.main_loop.quit()
             self.display_manager.cleanup()
-    
+
+    def _event_loop(self):
+        """Event-driven loop: redraw on PropertiesChanged signals.
+
+        Track and status changes arrive as DBus signals, so the display
+        reacts immediately instead of waiting out a sleep. A GLib timer at
+        update_interval only advances the progress bar; _should_update
+        still filters ticks where nothing moved enough to redraw.
+        """
+        self.main_loop = GLib.MainLoop()
+        GLib.timeout_add(int(self.config.update_interval * 1000), self._on_tick)
+        self._refresh()  # Draw the initial state
+        self.main_loop.run()
+
+    def _on_properties_changed(self, interface, changed, invalidated):
+        """Handle a PropertiesChanged signal from the player."""
+        self._refresh()
+
+    def _on_tick(self):
+        """Periodic GLib timer callback for progress-bar updates."""
+        self._refresh()
+        return self.running  # Returning False removes the timer
+
+    def _refresh(self):
+        """Fetch current metadata and update the display if needed."""
+        try:
+            metadata = self.mpris_client.get_metadata()
+
+            # Only update display if metadata changed or position updated significantly
+            if self._should_update(metadata):
+                if metadata:
+                    # %s args defer formatting until the record is emitted
+                    logger.debug("Updating display: %s - %s",
+                                 metadata.get('title'), metadata.get('artist'))
+                    self.display_manager.update_display(metadata)
+                    self.last_metadata = metadata
+                    self.last_metadata_key = self._metadata_key(metadata)
+                else:
+                    # No metadata available, show idle screen
+                    if self.last_metadata is not None:
+                        logger.info("No playback detected, showing idle screen")
+                        self.display_manager.show_idle()
+                        self.last_metadata = None
+                        self.last_metadata_key = None
+        except Exception as e:
+            logger.error(f"Error in update loop: {e}", exc_info=True)
+
     def _update_loop(self):
-        """Main update loop."""
+        """Polling fallback loop for players without signal support."""
         while self.running:
             try:
-                # Get current metadata
-                metadata = self.mpris_client.get_metadata()
-                
-                # Only update display if metadata changed or position updated significantly
-                if self._should_update(metadata):
-                    if metadata:
-                        logger.debug(f"Updating display: {metadata.get('title')} - {metadata.get('artist')}")
-                        self.display_manager.update_display(metadata)
-                        self.last_metadata = metadata
-                    else:
-                        # No metadata available, show idle screen
-                        if self.last_metadata is not None:
-                            logger.info("No playback detected, showing idle screen")
-                            self.display_manager.show_idle()
-                            self.last_metadata = None
-                
+                self._refresh()
+
                 # Sleep based on configuration
                 time.sleep(self.config.update_interval)
-                
+
             except KeyboardInterrupt:
                 break
-            except Exception as e:
-                logger.error(f"Error in update loop: {e}", exc_info=True)
-                time.sleep(5)  # Wait before retrying
     
+    @staticmethod
+    def _metadata_key(metadata: Dict[str, Any]) -> tuple:
+        """Identity of a frame apart from playback position."""
+        return (metadata.get('title'), metadata.get('artist'),
+                metadata.get('status'))
+
     def _should_update(self, metadata: Optional[Dict[str, Any]]) -> bool:
         """Determine if display should be updated."""
-        if metadata is None and self.last_metadata is None:
-            return False  # No change, both are None
-        
-        if metadata is None or self.last_metadata is None:
-            return True  # State changed
-        
-        # Check if track changed
-        if (metadata.get('title') != self.last_metadata.get('title') or
-            metadata.get('artist') != self.last_metadata.get('artist')):
-            return True
-        
-        # Check if playback status changed
-        if metadata.get('status') != self.last_metadata.get('status'):
+        if metadata is None:
+            return self.last_metadata is not None  # Changed iff we were playing
+
+        # One comparison against the precomputed key covers track and
+        # status changes (and the no-previous-frame case, where the key
+        # is None)
+        if self._metadata_key(metadata) != self.last_metadata_key:
             return True
-        
+
         # Update progress bar periodically during playback (only if position changed significantly)
         if metadata.get('status') == 'Playing':
             # Only update if position changed by more than 2 seconds to reduce e-paper wear
@@ -225,7 +306,11 @@ def main():
     """Main entry point."""
     # Load configuration
     config = Config()
-    
+
+    # Apply the configured log level at the root, so records below it are
+    # dropped by one check before reaching either handler
+    logging.getLogger().setLevel(config.log_level)
+
     # Create and start the application
     app = SpotifydDisplay(config)
     